@@ -4,28 +4,97 @@ Personal Task Manager - Console Application
 A comprehensive task management system with categories, priorities, and persistence.
 """
 
+import atexit
+import io
 import json
 import os
+import shutil
+import sys
 import datetime
 from enum import Enum
 from typing import List, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library json module
+    orjson = None  # type: ignore[assignment]
+
+def json_default(obj: object) -> str:
+    """Serialize datetime values for the stdlib json encoder"""
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dump_json(data: Dict) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=json_default).encode('utf-8')
+
+def dump_json_line(data: Dict) -> bytes:
+    """Serialize data to a single newline-terminated line of UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, ensure_ascii=False, default=json_default).encode('utf-8') + b"\n"
+
+def load_json(raw: bytes) -> Dict:
+    """Parse UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def copy_file(source: str, destination: str):
+    """Copy a file with os.sendfile where supported, else with a 1 MiB buffer"""
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        try:
+            size = os.fstat(src.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst, length=1 << 20)
+
 class Priority(Enum):
     LOW = "Low"
     MEDIUM = "Medium"
     HIGH = "High"
     URGENT = "Urgent"
 
+# Sort order for priorities, most important first
+PRIORITY_RANK = {Priority.URGENT: 0, Priority.HIGH: 1, Priority.MEDIUM: 2, Priority.LOW: 3}
+
 class Status(Enum):
     PENDING = "Pending"
     IN_PROGRESS = "In Progress"
     COMPLETED = "Completed"
     CANCELLED = "Cancelled"
 
+# Menu order for the priority and status pickers
+PRIORITIES = list(Priority)
+STATUSES = list(Status)
+
+# Stored value -> member lookups used when loading tasks
+PRIORITY_BY_VALUE = {priority.value: priority for priority in Priority}
+STATUS_BY_VALUE = {status.value: status for status in Status}
+
+# Icons shown next to each task in the full task listing
+STATUS_ICON = {Status.PENDING: "⏳", Status.IN_PROGRESS: "🔄", Status.COMPLETED: "✅", Status.CANCELLED: "⏳"}
+PRIORITY_ICON = {Priority.LOW: "🟢", Priority.MEDIUM: "🟢", Priority.HIGH: "🟡", Priority.URGENT: "🔴"}
+
 class Task:
+    __slots__ = ('id', 'title', 'description', 'category', 'priority', 'status',
+                 'created_at', 'updated_at', 'due_date', 'completed_at', '_due_str')
+    
     def __init__(self, title: str, description: str = "", category: str = "General", 
-                 priority: Priority = Priority.MEDIUM, due_date: str = None):
-        self.id = None  # Will be set by TaskManager
+                 priority: Priority = Priority.MEDIUM, due_date: Optional[str] = None) -> None:
+        self.id: int = 0  # Will be set by TaskManager
         self.title = title
         self.description = description
         self.category = category
@@ -33,35 +102,55 @@ class Task:
         self.status = Status.PENDING
         self.created_at = datetime.datetime.now()
         self.updated_at = datetime.datetime.now()
-        self.due_date = self._parse_date(due_date) if due_date else None
-        self.completed_at = None
+        self.due_date: Optional[datetime.datetime] = self._parse_date(due_date) if due_date else None
+        self.completed_at: Optional[datetime.datetime] = None
+        self._due_str = self._format_due(self.due_date)
     
     def _parse_date(self, date_str: str) -> Optional[datetime.datetime]:
         """Parse date string in format YYYY-MM-DD or DD/MM/YYYY"""
         try:
             if '-' in date_str:
-                return datetime.datetime.strptime(date_str, "%Y-%m-%d")
+                year, month, day = date_str.split('-')
             elif '/' in date_str:
-                return datetime.datetime.strptime(date_str, "%d/%m/%Y")
+                day, month, year = date_str.split('/')
+            else:
+                return None
+            # Match strptime: 4-digit year, 1-2 digit month and day, ASCII digits only
+            if (len(year) != 4 or not 1 <= len(month) <= 2 or not 1 <= len(day) <= 2
+                    or not (year + month + day).isascii() or not (year + month + day).isdigit()):
+                return None
+            return datetime.datetime(int(year), int(month), int(day))
         except ValueError:
             pass
         return None
     
-    def update_status(self, new_status: Status):
-        """Update task status and timestamp"""
+    @staticmethod
+    def _format_due(due_date: Optional[datetime.datetime]) -> str:
+        """Format the due date suffix used in the string representation"""
+        return f" (Due: {due_date.strftime('%Y-%m-%d')})" if due_date else ""
+    
+    def update_status(self, new_status: Status) -> bool:
+        """Update task status and timestamp; return False if the status is unchanged"""
+        if new_status == self.status:
+            return False
         self.status = new_status
         self.updated_at = datetime.datetime.now()
         if new_status == Status.COMPLETED:
             self.completed_at = datetime.datetime.now()
+        return True
     
     def is_overdue(self) -> bool:
         """Check if task is overdue"""
+        return self.is_overdue_at(datetime.datetime.now())
+    
+    def is_overdue_at(self, now: datetime.datetime) -> bool:
+        """Check if task is overdue relative to the given time"""
         if self.due_date and self.status != Status.COMPLETED:
-            return datetime.datetime.now() > self.due_date
+            return now > self.due_date
         return False
     
     def to_dict(self) -> Dict:
-        """Convert task to dictionary for JSON serialization"""
+        """Convert task to dictionary for JSON serialization (datetimes are left as-is)"""
         return {
             'id': self.id,
             'title': self.title,
@@ -69,10 +158,10 @@ class Task:
             'category': self.category,
             'priority': self.priority.value,
             'status': self.status.value,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'due_date': self.due_date.isoformat() if self.due_date else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'due_date': self.due_date,
+            'completed_at': self.completed_at
         }
     
     @classmethod
@@ -82,79 +171,232 @@ class Task:
             title=data['title'],
             description=data.get('description', ''),
             category=data.get('category', 'General'),
-            priority=Priority(data.get('priority', Priority.MEDIUM.value))
+            priority=PRIORITY_BY_VALUE[data.get('priority', Priority.MEDIUM.value)]
         )
-        task.id = data.get('id')
-        task.status = Status(data.get('status', Status.PENDING.value))
+        task.id = data.get('id', 0)
+        task.status = STATUS_BY_VALUE[data.get('status', Status.PENDING.value)]
         task.created_at = datetime.datetime.fromisoformat(data['created_at'])
         task.updated_at = datetime.datetime.fromisoformat(data['updated_at'])
         if data.get('due_date'):
             task.due_date = datetime.datetime.fromisoformat(data['due_date'])
+            task._due_str = cls._format_due(task.due_date)
         if data.get('completed_at'):
             task.completed_at = datetime.datetime.fromisoformat(data['completed_at'])
         return task
     
+    def describe(self, now: datetime.datetime) -> str:
+        """String representation of task, checking overdue status against the given time"""
+        overdue_str = " [OVERDUE]" if self.is_overdue_at(now) else ""
+        return f"[{self.id}] {self.title} - {self.status.value} - {self.priority.value}{self._due_str}{overdue_str}"
+    
     def __str__(self) -> str:
         """String representation of task"""
-        due_str = f" (Due: {self.due_date.strftime('%Y-%m-%d')})" if self.due_date else ""
-        overdue_str = " [OVERDUE]" if self.is_overdue() else ""
-        return f"[{self.id}] {self.title} - {self.status.value} - {self.priority.value}{due_str}{overdue_str}"
+        return self.describe(datetime.datetime.now())
 
 class TaskManager:
-    def __init__(self, filename: str = "tasks.json"):
+    """Task store backed by a JSON snapshot plus an append-only log of mutations.
+
+    Mutations are appended to ``<filename>.log`` as JSON lines and replayed on
+    load; the snapshot is rewritten (compacted) once the log holds more
+    entries than there are tasks.
+    """
+    
+    def __init__(self, filename: str = "tasks.json", save_threshold: int = 16) -> None:
         self.filename = filename
+        self.log_filename = filename + '.log'
         self.tasks: List[Task] = []
+        self._by_id: Dict[int, Task] = {}
+        self._by_category: Dict[str, List[Task]] = {}  # Keyed by lowercased category
+        self._by_status: Dict[Status, Dict[int, Task]] = {status: {} for status in Status}
+        self._sorted_cache: Optional[List[Task]] = None
         self.next_id = 1
+        self.save_threshold = save_threshold  # Mutations buffered before they are logged
+        self._dirty = False  # Snapshot is older than the in-memory tasks
+        self._pending_ops: List[Dict] = []
+        self._log_entries = 0
+        self._log: Optional[io.BufferedWriter] = None  # Opened for appends on the first flush
         self.load_tasks()
+        atexit.register(self.close)
     
-    def load_tasks(self):
-        """Load tasks from JSON file"""
+    def load_tasks(self) -> None:
+        """Load tasks from the JSON snapshot and replay the mutation log"""
+        compact = False
         try:
+            tasks: Dict[int, Task] = {}
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                    self.tasks = [Task.from_dict(task_data) for task_data in data['tasks']]
+                with open(self.filename, 'rb') as file:
+                    data = load_json(file.read())
+                    tasks = {task.id: task for task in map(Task.from_dict, data['tasks'])}
                     self.next_id = data.get('next_id', 1)
+            if os.path.exists(self.log_filename):
+                self._replay_log(tasks)
+                # Compact whenever the log has content, so a torn tail is never appended to
+                compact = os.path.getsize(self.log_filename) > 0
+            self.tasks = list(tasks.values())
         except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
             print(f"Error loading tasks: {e}")
             self.tasks = []
             self.next_id = 1
+        self._rebuild_index()
+        if compact:
+            self._dirty = True
+            self.save_tasks()
+    
+    def _replay_log(self, tasks: Dict[int, Task]) -> None:
+        """Apply logged mutations to tasks (keyed by ID)
+        
+        Entries that cannot be read or applied are skipped one at a time; a torn
+        final line (no trailing newline) from an interrupted append is skipped
+        silently, any other bad entry with a warning.
+        """
+        with open(self.log_filename, 'rb') as file:
+            for number, line in enumerate(file, 1):
+                try:
+                    self._apply_op(tasks, load_json(line))
+                except (KeyError, ValueError, TypeError) as e:
+                    if line.endswith(b"\n"):
+                        print(f"Skipping unreadable log entry {number}: {e}")
+    
+    def _apply_op(self, tasks: Dict[int, Task], op: Dict) -> None:
+        """Apply one logged mutation, validating it fully before changing anything"""
+        kind = op['op']
+        if kind == 'add':
+            task = Task.from_dict(op['task'])
+            next_id = max(self.next_id, task.id + 1)
+            tasks[task.id] = task
+            self.next_id = next_id
+        elif kind == 'upd':
+            status = STATUS_BY_VALUE[op['status']]
+            updated_at = datetime.datetime.fromisoformat(op['updated_at'])
+            completed_at = datetime.datetime.fromisoformat(op['completed_at']) if op['completed_at'] else None
+            updated = tasks.get(op['id'])
+            if updated:
+                updated.status = status
+                updated.updated_at = updated_at
+                if completed_at:
+                    updated.completed_at = completed_at
+        elif kind == 'del':
+            tasks.pop(op['id'], None)
+        elif kind == 'clear':
+            for task_id in [task_id for task_id, task in tasks.items() if task.status == Status.COMPLETED]:
+                del tasks[task_id]
+        elif kind == 'reset':
+            tasks.clear()
+            self.next_id = 1
+        else:
+            raise ValueError(f"unknown operation {kind!r}")
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild the id, category and status lookups from the task list"""
+        self._by_id = {task.id: task for task in self.tasks}
+        self._by_category = {}
+        self._by_status = {status: {} for status in Status}
+        self._sorted_cache = None
+        for task in self.tasks:
+            self._by_category.setdefault(task.category.lower(), []).append(task)
+            self._by_status[task.status][task.id] = task
     
-    def save_tasks(self):
-        """Save tasks to JSON file"""
+    def save_tasks(self) -> None:
+        """Write a full snapshot atomically via a temporary file and clear the log"""
+        if not self._dirty:
+            return
         try:
             data = {
                 'tasks': [task.to_dict() for task in self.tasks],
                 'next_id': self.next_id
             }
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            temp_filename = self.filename + '.tmp'
+            with open(temp_filename, 'wb') as file:
+                file.write(dump_json(data))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_filename, self.filename)
+            if self._log is not None:
+                self._log.truncate(0)
+            elif os.path.exists(self.log_filename):
+                os.remove(self.log_filename)
+            self._dirty = False
+            self._pending_ops = []
+            self._log_entries = 0
         except Exception as e:
             print(f"Error saving tasks: {e}")
     
+    def _record(self, op: Dict) -> None:
+        """Queue a mutation for the log and write once enough of them have accumulated"""
+        self._dirty = True
+        self._pending_ops.append(op)
+        if len(self._pending_ops) >= self.save_threshold:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Append queued mutations to the log, compacting it once it outgrows the snapshot"""
+        if not self._pending_ops:
+            return
+        log_size = None
+        try:
+            if self._log is None:
+                self._log = open(self.log_filename, 'ab')
+            log_size = os.fstat(self._log.fileno()).st_size
+            # A buffered write either writes everything or raises
+            self._log.write(b"".join(map(dump_json_line, self._pending_ops)))
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._log_entries += len(self._pending_ops)
+            self._pending_ops = []
+        except Exception as e:
+            print(f"Error saving tasks: {e}")
+            # Drop any partly written batch so the queued mutations can be retried cleanly
+            if self._log is not None:
+                try:
+                    self._log.close()
+                except OSError:
+                    pass
+                self._log = None
+            if log_size is not None:
+                try:
+                    os.truncate(self.log_filename, log_size)
+                except OSError:
+                    pass
+            return
+        if self._log_entries > len(self.tasks):
+            self.save_tasks()
+    
+    def close(self) -> None:
+        """Flush queued mutations, close the log file and drop the exit hook"""
+        self.flush()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        atexit.unregister(self.close)
+    
     def add_task(self, title: str, description: str = "", category: str = "General", 
-                 priority: Priority = Priority.MEDIUM, due_date: str = None) -> Task:
+                 priority: Priority = Priority.MEDIUM, due_date: Optional[str] = None) -> Task:
         """Add a new task"""
         task = Task(title, description, category, priority, due_date)
         task.id = self.next_id
         self.next_id += 1
         self.tasks.append(task)
-        self.save_tasks()
+        self._by_id[task.id] = task
+        self._by_category.setdefault(task.category.lower(), []).append(task)
+        self._by_status[task.status][task.id] = task
+        self._sorted_cache = None
+        self._record({'op': 'add', 'task': task.to_dict()})
         return task
     
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get task by ID"""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
     
     def update_task_status(self, task_id: int, new_status: Status) -> bool:
         """Update task status"""
         task = self.get_task(task_id)
         if task:
-            task.update_status(new_status)
-            self.save_tasks()
+            old_status = task.status
+            if task.update_status(new_status):
+                del self._by_status[old_status][task_id]
+                self._by_status[new_status][task_id] = task
+                self._record({'op': 'upd', 'id': task_id, 'status': new_status.value,
+                              'updated_at': task.updated_at, 'completed_at': task.completed_at})
             return True
         return False
     
@@ -163,33 +405,74 @@ class TaskManager:
         task = self.get_task(task_id)
         if task:
             self.tasks.remove(task)
-            self.save_tasks()
+            del self._by_id[task_id]
+            key = task.category.lower()
+            self._by_category[key].remove(task)
+            if not self._by_category[key]:
+                del self._by_category[key]
+            del self._by_status[task.status][task_id]
+            self._sorted_cache = None
+            self._record({'op': 'del', 'id': task_id})
             return True
         return False
     
+    def clear_completed_tasks(self) -> None:
+        """Delete all completed tasks"""
+        if not self._by_status[Status.COMPLETED]:
+            return
+        self.tasks = [task for task in self.tasks if task.status != Status.COMPLETED]
+        self._rebuild_index()
+        self._record({'op': 'clear'})
+        self.flush()  # Log the op first, so replaying a log left behind by a crash keeps it cleared
+        self.save_tasks()
+    
+    def reset_tasks(self) -> None:
+        """Delete all tasks and restart ID numbering"""
+        if not self.tasks and self.next_id == 1:
+            return
+        self.tasks = []
+        self.next_id = 1
+        self._rebuild_index()
+        self._record({'op': 'reset'})
+        self.flush()  # Log the op first, so replaying a log left behind by a crash keeps it reset
+        self.save_tasks()
+    
+    def get_sorted_tasks(self) -> List[Task]:
+        """Get tasks sorted by priority and due date (cached until tasks are added or removed)"""
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self.tasks,
+                                        key=lambda t: (PRIORITY_RANK[t.priority], t.due_date or datetime.datetime.max))
+        return self._sorted_cache
+    
     def get_tasks_by_status(self, status: Status) -> List[Task]:
-        """Get tasks filtered by status"""
-        return [task for task in self.tasks if task.status == status]
+        """Get tasks filtered by status, in ID order"""
+        return sorted(self._by_status[status].values(), key=lambda t: t.id)
     
     def get_tasks_by_category(self, category: str) -> List[Task]:
         """Get tasks filtered by category"""
-        return [task for task in self.tasks if task.category.lower() == category.lower()]
+        return list(self._by_category.get(category.lower(), ()))
     
     def get_overdue_tasks(self) -> List[Task]:
         """Get overdue tasks"""
-        return [task for task in self.tasks if task.is_overdue()]
+        now = datetime.datetime.now()
+        return [task for task in self.tasks
+                if task.due_date and task.status != Status.COMPLETED and now > task.due_date]
     
     def get_categories(self) -> List[str]:
-        """Get all unique categories"""
-        return list(set(task.category for task in self.tasks))
+        """Get all unique categories (case-insensitive, as first spelled) in order of first use"""
+        return [tasks[0].category for tasks in self._by_category.values()]
     
     def get_statistics(self) -> Dict:
         """Get task statistics"""
         total = len(self.tasks)
-        completed = len([t for t in self.tasks if t.status == Status.COMPLETED])
-        pending = len([t for t in self.tasks if t.status == Status.PENDING])
-        in_progress = len([t for t in self.tasks if t.status == Status.IN_PROGRESS])
-        overdue = len(self.get_overdue_tasks())
+        completed = len(self._by_status[Status.COMPLETED])
+        pending = len(self._by_status[Status.PENDING])
+        in_progress = len(self._by_status[Status.IN_PROGRESS])
+        overdue = 0
+        now = datetime.datetime.now()
+        for t in self.tasks:
+            if t.due_date and t.status != Status.COMPLETED and now > t.due_date:
+                overdue += 1
         
         return {
             'total': total,
@@ -253,25 +536,25 @@ class TaskManagerApp:
     def get_priority_choice(self) -> Priority:
         """Get priority choice from user"""
         print("\n🎯 Priority levels:")
-        for i, priority in enumerate(Priority, 1):
+        for i, priority in enumerate(PRIORITIES, 1):
             print(f"{i}. {priority.value}")
         
         while True:
             choice = self.get_user_input("Select priority (1-4): ", int)
             if 1 <= choice <= 4:
-                return list(Priority)[choice - 1]
+                return PRIORITIES[choice - 1]
             print("❌ Invalid choice. Please select 1-4.")
     
     def get_status_choice(self) -> Status:
         """Get status choice from user"""
         print("\n📊 Status options:")
-        for i, status in enumerate(Status, 1):
+        for i, status in enumerate(STATUSES, 1):
             print(f"{i}. {status.value}")
         
         while True:
             choice = self.get_user_input("Select status (1-4): ", int)
             if 1 <= choice <= 4:
-                return list(Status)[choice - 1]
+                return STATUSES[choice - 1]
             print("❌ Invalid choice. Please select 1-4.")
     
     def add_task(self):
@@ -301,19 +584,16 @@ class TaskManagerApp:
         if not self.task_manager.tasks:
             print("📭 No tasks found.")
         else:
-            # Sort tasks by priority and due date
-            sorted_tasks = sorted(self.task_manager.tasks, 
-                                key=lambda t: (t.priority.value, t.due_date or datetime.datetime.max))
-            
-            for task in sorted_tasks:
-                status_icon = "✅" if task.status == Status.COMPLETED else "🔄" if task.status == Status.IN_PROGRESS else "⏳"
-                priority_icon = "🔴" if task.priority == Priority.URGENT else "🟡" if task.priority == Priority.HIGH else "🟢"
-                
-                print(f"\n{status_icon} {priority_icon} {task}")
+            # Build the whole listing first and write it in one call
+            lines = []
+            now = datetime.datetime.now()
+            for task in self.task_manager.get_sorted_tasks():
+                lines.append(f"\n{STATUS_ICON[task.status]} {PRIORITY_ICON[task.priority]} {task.describe(now)}")
                 if task.description:
-                    print(f"   💬 {task.description}")
-                print(f"   📁 Category: {task.category}")
-                print(f"   📅 Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
+                    lines.append(f"   💬 {task.description}")
+                lines.append(f"   📁 Category: {task.category}")
+                lines.append(f"   📅 Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
+            sys.stdout.write("\n".join(lines) + "\n")
         
         input("\nPress Enter to continue...")
     
@@ -329,8 +609,9 @@ class TaskManagerApp:
             print(f"📭 No tasks found with status '{status.value}'.")
         else:
             print(f"\n📊 Tasks with status '{status.value}':")
+            now = datetime.datetime.now()
             for task in tasks:
-                print(f"  • {task}")
+                print(f"  • {task.describe(now)}")
         
         input("\nPress Enter to continue...")
     
@@ -355,8 +636,9 @@ class TaskManagerApp:
             tasks = self.task_manager.get_tasks_by_category(selected_category)
             
             print(f"\n📁 Tasks in category '{selected_category}':")
+            now = datetime.datetime.now()
             for task in tasks:
-                print(f"  • {task}")
+                print(f"  • {task.describe(now)}")
         else:
             print("❌ Invalid category selection.")
         
@@ -374,8 +656,9 @@ class TaskManagerApp:
         
         # Show available tasks
         print("\n📋 Available tasks:")
+        now = datetime.datetime.now()
         for task in self.task_manager.tasks:
-            print(f"  {task}")
+            print(f"  {task.describe(now)}")
         
         task_id = self.get_user_input("\n🔢 Enter task ID to update: ", int)
         task = self.task_manager.get_task(task_id)
@@ -406,8 +689,9 @@ class TaskManagerApp:
         
         # Show available tasks
         print("\n📋 Available tasks:")
+        now = datetime.datetime.now()
         for task in self.task_manager.tasks:
-            print(f"  {task}")
+            print(f"  {task.describe(now)}")
         
         task_id = self.get_user_input("\n🔢 Enter task ID to delete: ", int)
         task = self.task_manager.get_task(task_id)
@@ -439,9 +723,10 @@ class TaskManagerApp:
             print("🎉 No overdue tasks!")
         else:
             print(f"⚠️ You have {len(overdue_tasks)} overdue task(s):")
+            now = datetime.datetime.now()
             for task in overdue_tasks:
-                days_overdue = (datetime.datetime.now() - task.due_date).days
-                print(f"  🔴 {task} (Overdue by {days_overdue} days)")
+                days_overdue = (now - task.due_date).days
+                print(f"  🔴 {task.describe(now)} (Overdue by {days_overdue} days)")
         
         input("\nPress Enter to continue...")
     
@@ -500,13 +785,13 @@ class TaskManagerApp:
         """Export tasks to a readable format"""
         filename = f"tasks_export_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            with open(filename, 'w', encoding='utf-8') as file:
+            with open(filename, 'wb') as file:
                 data = {
-                    'exported_at': datetime.datetime.now().isoformat(),
+                    'exported_at': datetime.datetime.now(),
                     'total_tasks': len(self.task_manager.tasks),
                     'tasks': [task.to_dict() for task in self.task_manager.tasks]
                 }
-                json.dump(data, file, indent=2, ensure_ascii=False)
+                file.write(dump_json(data))
             print(f"✅ Tasks exported to {filename}")
         except Exception as e:
             print(f"❌ Error exporting tasks: {e}")
@@ -515,8 +800,8 @@ class TaskManagerApp:
         """Create a backup of tasks"""
         backup_filename = f"tasks_backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            import shutil
-            shutil.copy2(self.task_manager.filename, backup_filename)
+            self.task_manager.save_tasks()  # Fold the mutation log into the snapshot first
+            copy_file(self.task_manager.filename, backup_filename)
             print(f"✅ Backup created: {backup_filename}")
         except Exception as e:
             print(f"❌ Error creating backup: {e}")
@@ -532,8 +817,7 @@ class TaskManagerApp:
         confirm = self.get_user_input("⚠️ Are you sure you want to delete all completed tasks? (yes/no): ").lower()
         
         if confirm in ['yes', 'y']:
-            self.task_manager.tasks = [t for t in self.task_manager.tasks if t.status != Status.COMPLETED]
-            self.task_manager.save_tasks()
+            self.task_manager.clear_completed_tasks()
             print("✅ All completed tasks cleared!")
         else:
             print("❌ Operation cancelled.")
@@ -548,9 +832,7 @@ class TaskManagerApp:
         confirm = self.get_user_input("⚠️ Are you absolutely sure? Type 'DELETE ALL' to confirm: ")
         
         if confirm == 'DELETE ALL':
-            self.task_manager.tasks = []
-            self.task_manager.next_id = 1
-            self.task_manager.save_tasks()
+            self.task_manager.reset_tasks()
             print("✅ All tasks have been reset!")
         else:
             print("❌ Operation cancelled.")
@@ -599,6 +881,8 @@ class TaskManagerApp:
             except Exception as e:
                 print(f"❌ An error occurred: {e}")
                 input("\nPress Enter to continue...")
+            
+            self.task_manager.flush()
 
 def main():
     """Main function"""